@@ -0,0 +1,131 @@
+# Copyright 2012 Pinterest.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Accelerated socket read helpers.
+
+These are drop-in replacements for the pure Python ``_readline`` and
+``_readvalue`` helpers in ``pymemcache.client.base``. The delimiter scan
+uses ``memchr``, which glibc vectorizes, instead of Python-level
+``find``. The extension is optional: it is only built when Cython is
+available at install time, and ``base`` silently falls back to the pure
+Python implementations when it cannot be imported.
+"""
+import errno
+
+from libc.string cimport memchr
+
+from cpython.bytearray cimport PyByteArray_AS_STRING
+
+from pymemcache.exceptions import (
+    MemcacheUnexpectedCloseError,
+    MemcacheUnknownError,
+)
+
+
+DEF RECV_SIZE = 4096
+# Keep in sync with pymemcache.client.base.MAX_LINE_SIZE.
+DEF MAX_LINE_SIZE = 4 * 1024 * 1024
+
+
+cdef Py_ssize_t _find_crlf(const char *p, Py_ssize_t start,
+                           Py_ssize_t length) nogil:
+    """Return the offset of the first "\r\n" at or after start, or -1."""
+    cdef const char *q = p + start
+    cdef const char *end = p + length
+    cdef const char *r
+    while q < end:
+        r = <const char *>memchr(q, 0x0d, end - q)
+        if r == NULL or r + 1 == end:
+            return -1
+        if r[1] == 0x0a:
+            return r - p
+        q = r + 1
+    return -1
+
+
+cdef _recv(sock, recv):
+    """Call a bound sock.recv with retry on EINTR."""
+    while True:
+        try:
+            return recv(RECV_SIZE)
+        except IOError as e:
+            if e.errno != errno.EINTR:
+                raise
+
+
+def readline(sock, bytes buf):
+    """C implementation of pymemcache.client.base._readline."""
+    cdef const char *p = buf
+    cdef Py_ssize_t idx, scan, length
+    cdef bytearray data
+
+    # The scans below run without the GIL so other threads can make
+    # progress while large buffers are searched. The recv calls
+    # themselves already release the GIL inside CPython's socket module
+    # for the duration of the syscall, so blocking network waits from
+    # one client never serialize the rest of a thread pool.
+    length = len(buf)
+    with nogil:
+        # Fast path: the delimiter is already buffered.
+        idx = _find_crlf(p, 0, length)
+    if idx != -1:
+        return buf[idx + 2:], buf[:idx]
+
+    data = bytearray(buf)
+    recv = sock.recv
+    while True:
+        # Back up one byte so a "\r\n" split across a chunk boundary is
+        # still found.
+        scan = len(data) - 1 if len(data) > 0 else 0
+        chunk = _recv(sock, recv)
+        if not chunk:
+            raise MemcacheUnexpectedCloseError()
+        data += chunk
+        p = PyByteArray_AS_STRING(data)
+        length = len(data)
+        with nogil:
+            idx = _find_crlf(p, scan, length)
+        if idx != -1:
+            return bytes(data[idx + 2:]), bytes(data[:idx])
+        if length > MAX_LINE_SIZE:
+            raise MemcacheUnknownError(
+                'Response line exceeded %d bytes' % MAX_LINE_SIZE)
+
+
+def readvalue(sock, bytes buf, Py_ssize_t size):
+    """C implementation of pymemcache.client.base._readvalue."""
+    cdef Py_ssize_t want = size + 2
+    cdef Py_ssize_t have = len(buf)
+    cdef Py_ssize_t received
+    cdef bytearray data
+
+    # Fast path: the value (and its trailing "\r\n") is already buffered.
+    if have >= want:
+        return buf[want:], buf[:size]
+
+    data = bytearray(want)
+    data[:have] = buf
+    recv_into = sock.recv_into
+    view = memoryview(data)
+    while have < want:
+        try:
+            received = recv_into(view[have:])
+        except IOError as e:
+            if e.errno != errno.EINTR:
+                raise
+            continue
+        if not received:
+            raise MemcacheUnexpectedCloseError()
+        have += received
+
+    return b'', view[:size].tobytes()
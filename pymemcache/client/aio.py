@@ -0,0 +1,508 @@
+# Copyright 2012 Pinterest.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An asyncio-based memcached client.
+
+This module requires Python 3.5 or newer and is therefore not imported
+from the package root, which still supports Python 2. Import it
+explicitly::
+
+    from pymemcache.client.aio import AsyncClient
+
+:py:class:`AsyncClient` speaks the same wire protocol as
+:py:class:`pymemcache.client.base.Client` but performs its socket I/O
+through an :py:class:`asyncio.StreamReader`/``StreamWriter`` pair, so
+many coroutines on one event loop can share a single connection instead
+of paying a serial round trip (or a pooled connection) per concurrent
+call.
+"""
+import asyncio
+import socket
+
+from pymemcache.client import base
+from pymemcache.exceptions import (
+    MemcacheUnexpectedCloseError,
+    MemcacheUnknownError,
+)
+from pymemcache.serde import LegacyWrappingSerde
+
+
+class AsyncClient(object):
+    """An asyncio client for a single memcached server.
+
+    All commands are coroutines:
+
+    .. code-block:: python
+
+        client = AsyncClient(('localhost', 11211))
+        await client.set(b'key', b'value')
+        value = await client.get(b'key')
+
+    Concurrent callers share the connection: an internal
+    :py:class:`asyncio.Lock` is held for exactly one request/reply
+    exchange at a time, so responses are never interleaved, and the
+    ``*_many`` methods write every request before awaiting the first
+    reply, so a batch still costs a single round trip.
+
+    The constructor arguments mirror :py:class:`.Client` where they
+    apply; ``socket_module`` and the socket buffer options are absent
+    because the event loop owns the socket. See the synchronous class
+    docs for key/value, serde, and error-handling semantics -- as there,
+    the connection is closed on any error and reopened by the next
+    command.
+    """
+
+    def __init__(self,
+                 server,
+                 serde=None,
+                 serializer=None,
+                 deserializer=None,
+                 connect_timeout=None,
+                 timeout=None,
+                 no_delay=True,
+                 ignore_exc=False,
+                 key_prefix=b'',
+                 default_noreply=True,
+                 allow_unicode_keys=False,
+                 encoding='ascii'):
+        """
+        Constructor.
+
+        Args:
+          server: tuple(hostname, port) or string containing a UNIX
+            socket path.
+          serde: optional serializer object, see
+            :py:class:`.Client` docs for details.
+          serializer: deprecated serialization function
+          deserializer: deprecated deserialization function
+          connect_timeout: optional float, seconds to wait for a
+            connection to the memcached server.
+          timeout: optional float, seconds to wait for each read of a
+            reply from memcached.
+          no_delay: optional bool, set the TCP_NODELAY flag, which
+            avoids up to 40ms of delayed-ACK latency on small
+            request/reply exchanges. Defaults to True.
+          ignore_exc: optional bool, True to cause the "get", "gets",
+            "get_many" and "gets_many" calls to treat any errors as
+            cache misses. Defaults to False.
+          key_prefix: Prefix of key. You can use this as namespace.
+            Defaults to b''.
+          default_noreply: bool, the default value for 'noreply' as
+            passed to store commands (except from cas, incr, and decr,
+            which default to False).
+          allow_unicode_keys: bool, support unicode (utf8) keys
+          encoding: optional str, controls data encoding (defaults to
+            'ascii').
+        """
+        self.server = server
+        self.serde = serde or LegacyWrappingSerde(serializer, deserializer)
+        self._passthrough_deserializer = getattr(
+            self.serde, 'passthrough_deserializer', False)
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+        self.no_delay = no_delay
+        self.ignore_exc = ignore_exc
+        if isinstance(key_prefix, str):
+            key_prefix = key_prefix.encode('ascii')
+        if not isinstance(key_prefix, bytes):
+            raise TypeError("key_prefix should be bytes.")
+        self.key_prefix = key_prefix
+        self.default_noreply = default_noreply
+        self.allow_unicode_keys = allow_unicode_keys
+        self.encoding = encoding
+        self._reader = None
+        self._writer = None
+        self._lock = None
+
+    # The command validators and error dispatch are shared with the
+    # synchronous client; only the socket I/O differs.
+    check_key = base.Client.check_key
+    _raise_errors = base.Client._raise_errors
+    _serialize_value = base.Client._serialize_value
+    _check_integer = base.Client._check_integer
+    _check_cas = base.Client._check_cas
+
+    def _ensure_lock(self):
+        # Created lazily so the lock binds to the running event loop
+        # rather than whichever loop was current at construction time.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _connect(self):
+        if isinstance(self.server, (list, tuple)):
+            connect = asyncio.open_connection(*self.server)
+        else:
+            connect = asyncio.open_unix_connection(self.server)
+        if self.connect_timeout is not None:
+            connect = asyncio.wait_for(connect, self.connect_timeout)
+        reader, writer = await connect
+
+        if self.no_delay:
+            sock = writer.get_extra_info('socket')
+            if sock is not None and sock.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._reader = reader
+        self._writer = writer
+
+    def close(self):
+        """Close the connection to memcached, if it is open. The next
+        command will re-open it."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            finally:
+                self._reader = None
+                self._writer = None
+
+    async def _readline(self):
+        read = self._reader.readuntil(b'\r\n')
+        if self.timeout is not None:
+            read = asyncio.wait_for(read, self.timeout)
+        try:
+            line = await read
+        except asyncio.IncompleteReadError:
+            raise MemcacheUnexpectedCloseError()
+        except asyncio.LimitOverrunError:
+            # A line exceeding the stream's buffer limit means the
+            # server is streaming garbage; fail like the synchronous
+            # client's MAX_LINE_SIZE cap instead of leaking an asyncio
+            # exception.
+            raise MemcacheUnknownError('Response line exceeded stream limit')
+        return line[:-2]
+
+    async def _readvalue(self, size):
+        read = self._reader.readexactly(size + 2)
+        if self.timeout is not None:
+            read = asyncio.wait_for(read, self.timeout)
+        try:
+            data = await read
+        except asyncio.IncompleteReadError:
+            raise MemcacheUnexpectedCloseError()
+        return data[:-2]
+
+    async def _extract_value(self, expect_cas, line, remapped_keys):
+        # The line is b'VALUE <key> <flags> <size>[ <cas>]'.
+        try:
+            p1 = line.find(b' ', 6)
+            p2 = line.find(b' ', p1 + 1)
+            key = line[6:p1]
+            flags = line[p1 + 1:p2]
+            if expect_cas:
+                p3 = line.find(b' ', p2 + 1)
+                size = int(line[p2 + 1:p3])
+                cas = line[p3 + 1:]
+            else:
+                size = int(line[p2 + 1:])
+        except Exception as e:
+            raise ValueError("Unable to parse line %s: %s" % (line, e))
+
+        value = await self._readvalue(size)
+        key = remapped_keys[key]
+        if not self._passthrough_deserializer:
+            value = self.serde.deserialize(key, value, int(flags))
+        if expect_cas:
+            return key, (value, cas)
+        return key, value
+
+    async def _fetch_cmd(self, name, keys, expect_cas):
+        prefixed_keys = [self.check_key(k) for k in keys]
+        remapped_keys = dict(zip(prefixed_keys, keys))
+
+        # It is important for all keys to be listed in their original order.
+        cmd = name + b' ' + b' '.join(prefixed_keys) + b'\r\n'
+
+        try:
+            async with self._ensure_lock():
+                if self._writer is None:
+                    await self._connect()
+                self._writer.write(cmd)
+                await self._writer.drain()
+
+                result = {}
+                while True:
+                    line = await self._readline()
+                    self._raise_errors(line, name)
+                    if line == b'END' or line == b'OK':
+                        return result
+                    elif line.startswith(b'VALUE'):
+                        key, value = await self._extract_value(
+                            expect_cas, line, remapped_keys)
+                        result[key] = value
+                    else:
+                        raise MemcacheUnknownError(line[:32])
+        except Exception:
+            self.close()
+            if self.ignore_exc:
+                return {}
+            raise
+
+    async def _store_cmd(self, name, values, expire, noreply, flags=None,
+                         cas=None):
+        cmds = []
+        keys = []
+
+        if cas is not None:
+            cas = self._check_cas(cas)
+        extra = base._STORE_EXTRA[cas is not None, bool(noreply)](cas)
+        expire = self._check_integer(expire, "expire")
+
+        for key, data in values.items():
+            # must be able to reliably map responses back to the original
+            # order
+            keys.append(key)
+
+            key = self.check_key(key)
+            data, data_flags = self._serialize_value(key, data)
+
+            # If 'flags' was explicitly provided, it overrides the value
+            # returned by the serializer.
+            if flags is not None:
+                data_flags = flags
+
+            cmds.append(b''.join((
+                name, b' ', key, b' ',
+                str(data_flags).encode(self.encoding),
+                b' ', expire, b' ',
+                str(len(data)).encode(self.encoding),
+                extra, b'\r\n', data, b'\r\n')))
+
+        try:
+            async with self._ensure_lock():
+                if self._writer is None:
+                    await self._connect()
+                # Every request is written before the first reply is
+                # awaited, so a batch costs a single round trip.
+                self._writer.write(b''.join(cmds))
+                await self._writer.drain()
+                if noreply:
+                    return {k: True for k in keys}
+
+                results = {}
+                for key in keys:
+                    line = await self._readline()
+                    self._raise_errors(line, name)
+
+                    if line in base.VALID_STORE_RESULTS[name]:
+                        if line == b'STORED':
+                            results[key] = True
+                        if line == b'NOT_STORED':
+                            results[key] = False
+                        if line == b'NOT_FOUND':
+                            results[key] = None
+                        if line == b'EXISTS':
+                            results[key] = False
+                    else:
+                        raise MemcacheUnknownError(line[:32])
+                return results
+        except Exception:
+            self.close()
+            raise
+
+    async def _misc_cmd(self, cmds, cmd_name, noreply):
+        try:
+            async with self._ensure_lock():
+                if self._writer is None:
+                    await self._connect()
+                self._writer.write(b''.join(cmds))
+                await self._writer.drain()
+
+                if noreply:
+                    return []
+
+                results = []
+                for cmd in cmds:
+                    line = await self._readline()
+                    self._raise_errors(line, cmd_name)
+                    results.append(line)
+                return results
+        except Exception:
+            self.close()
+            raise
+
+    async def set(self, key, value, expire=0, noreply=None, flags=None):
+        """The memcached "set" command; see :py:meth:`.Client.set`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        result = await self._store_cmd(b'set', {key: value}, expire,
+                                       noreply, flags=flags)
+        return result[key]
+
+    async def set_many(self, values, expire=0, noreply=None, flags=None):
+        """The memcached "set" command for multiple keys; see
+        :py:meth:`.Client.set_many`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        result = await self._store_cmd(b'set', values, expire, noreply,
+                                       flags=flags)
+        return [k for k, v in result.items() if not v]
+
+    set_multi = set_many
+
+    async def add(self, key, value, expire=0, noreply=None, flags=None):
+        """The memcached "add" command; see :py:meth:`.Client.add`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        result = await self._store_cmd(b'add', {key: value}, expire,
+                                       noreply, flags=flags)
+        return result[key]
+
+    async def replace(self, key, value, expire=0, noreply=None, flags=None):
+        """The memcached "replace" command; see
+        :py:meth:`.Client.replace`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        result = await self._store_cmd(b'replace', {key: value}, expire,
+                                       noreply, flags=flags)
+        return result[key]
+
+    async def append(self, key, value, expire=0, noreply=None, flags=None):
+        """The memcached "append" command; see
+        :py:meth:`.Client.append`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        result = await self._store_cmd(b'append', {key: value}, expire,
+                                       noreply, flags=flags)
+        return result[key]
+
+    async def prepend(self, key, value, expire=0, noreply=None, flags=None):
+        """The memcached "prepend" command; see
+        :py:meth:`.Client.prepend`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        result = await self._store_cmd(b'prepend', {key: value}, expire,
+                                       noreply, flags=flags)
+        return result[key]
+
+    async def cas(self, key, value, cas, expire=0, noreply=False, flags=None):
+        """The memcached "cas" command; see :py:meth:`.Client.cas`."""
+        result = await self._store_cmd(b'cas', {key: value}, expire,
+                                       noreply, flags=flags, cas=cas)
+        return result[key]
+
+    async def get(self, key, default=None):
+        """The memcached "get" command; see :py:meth:`.Client.get`."""
+        result = await self._fetch_cmd(b'get', [key], False)
+        return result.get(key, default)
+
+    async def get_many(self, keys):
+        """The memcached "get" command for multiple keys; see
+        :py:meth:`.Client.get_many`."""
+        if not keys:
+            return {}
+        return await self._fetch_cmd(b'get', keys, False)
+
+    get_multi = get_many
+
+    async def gets(self, key, default=None, cas_default=None):
+        """The memcached "gets" command; see :py:meth:`.Client.gets`."""
+        defaults = (default, cas_default)
+        result = await self._fetch_cmd(b'gets', [key], True)
+        return result.get(key, defaults)
+
+    async def gets_many(self, keys):
+        """The memcached "gets" command for multiple keys; see
+        :py:meth:`.Client.gets_many`."""
+        if not keys:
+            return {}
+        return await self._fetch_cmd(b'gets', keys, True)
+
+    gets_multi = gets_many
+
+    async def delete(self, key, noreply=None):
+        """The memcached "delete" command; see
+        :py:meth:`.Client.delete`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        cmd = (base._DELETE_NOREPLY_CMD if noreply else base._DELETE_CMD) % (
+            self.check_key(key),)
+        results = await self._misc_cmd([cmd], b'delete', noreply)
+        if noreply:
+            return True
+        return results[0] == b'DELETED'
+
+    async def delete_many(self, keys, noreply=None):
+        """A convenience function to delete multiple keys; see
+        :py:meth:`.Client.delete_many`."""
+        if not keys:
+            return True
+
+        if noreply is None:
+            noreply = self.default_noreply
+
+        template = base._DELETE_NOREPLY_CMD if noreply else base._DELETE_CMD
+        cmds = [template % (self.check_key(key),) for key in keys]
+        await self._misc_cmd(cmds, b'delete', noreply)
+        return True
+
+    delete_multi = delete_many
+
+    async def incr(self, key, value, noreply=False):
+        """The memcached "incr" command; see :py:meth:`.Client.incr`."""
+        key = self.check_key(key)
+        value = self._check_integer(value, "value")
+        cmd = (base._INCR_NOREPLY_CMD if noreply else base._INCR_CMD) % (
+            key, value)
+        results = await self._misc_cmd([cmd], b'incr', noreply)
+        if noreply:
+            return None
+        if results[0] == b'NOT_FOUND':
+            return None
+        return int(results[0])
+
+    async def decr(self, key, value, noreply=False):
+        """The memcached "decr" command; see :py:meth:`.Client.decr`."""
+        key = self.check_key(key)
+        value = self._check_integer(value, "value")
+        cmd = (base._DECR_NOREPLY_CMD if noreply else base._DECR_CMD) % (
+            key, value)
+        results = await self._misc_cmd([cmd], b'decr', noreply)
+        if noreply:
+            return None
+        if results[0] == b'NOT_FOUND':
+            return None
+        return int(results[0])
+
+    async def touch(self, key, expire=0, noreply=None):
+        """The memcached "touch" command; see :py:meth:`.Client.touch`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        key = self.check_key(key)
+        expire = self._check_integer(expire, "expire")
+        cmd = (base._TOUCH_NOREPLY_CMD if noreply else base._TOUCH_CMD) % (
+            key, expire)
+        results = await self._misc_cmd([cmd], b'touch', noreply)
+        if noreply:
+            return True
+        return results[0] == b'TOUCHED'
+
+    async def flush_all(self, delay=0, noreply=None):
+        """The memcached "flush_all" command; see
+        :py:meth:`.Client.flush_all`."""
+        if noreply is None:
+            noreply = self.default_noreply
+        delay = self._check_integer(delay, "delay")
+        cmd = (base._FLUSH_ALL_NOREPLY_CMD if noreply
+               else base._FLUSH_ALL_CMD) % (delay,)
+        results = await self._misc_cmd([cmd], b'flush_all', noreply)
+        if noreply:
+            return True
+        return results[0] == b'OK'
+
+    async def quit(self):
+        """The memcached "quit" command; see :py:meth:`.Client.quit`."""
+        await self._misc_cmd([b'quit\r\n'], b'quit', True)
+        self.close()
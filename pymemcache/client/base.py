@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
 import errno
 import socket
 import six
@@ -29,6 +30,22 @@ from pymemcache.exceptions import (
 
 
 RECV_SIZE = 4096
+# When batching commands, coalesce and flush once the accumulated batch
+# reaches roughly this many bytes. One large write amortizes syscall and
+# TCP overhead, while flushing at a threshold keeps the peak size of the
+# joined buffer bounded for very large batches.
+SEND_BATCH_SIZE = 128 * 1024
+# Default size, in bytes, requested for the kernel's socket send and
+# receive buffers. The kernel default is often 16-32KB, which is small
+# enough to force extra send/recv round trips for multi-kilobyte values.
+SOCKET_BUFFER_SIZE = 128 * 1024
+# Maximum number of entries kept by the opt-in serializer cache.
+SERIALIZER_CACHE_SIZE = 128
+# Hard cap on how much data _readline may buffer while looking for the
+# "\r\n" terminator. Protocol lines are tiny; reaching this limit means
+# the server is streaming garbage, and failing fast bounds the memory a
+# bad server can make the client allocate.
+MAX_LINE_SIZE = 4 * 1024 * 1024
 VALID_STORE_RESULTS = {
     b'set':     (b'STORED', b'NOT_STORED'),
     b'add':     (b'STORED', b'NOT_STORED'),
@@ -38,6 +55,35 @@ VALID_STORE_RESULTS = {
     b'cas':     (b'STORED', b'EXISTS', b'NOT_FOUND'),
 }
 VALID_STRING_TYPES = (six.text_type, six.string_types)
+# The trailing options of a store command, keyed on
+# (cas is present, noreply); a single table lookup replaces a chain of
+# branches in the hot path.
+_STORE_EXTRA = {
+    (False, False): lambda cas: b'',
+    (False, True): lambda cas: b' noreply',
+    (True, False): lambda cas: b' ' + cas,
+    (True, True): lambda cas: b' ' + cas + b' noreply',
+}
+# Precomputed wire templates for the simple line commands, one variant
+# with noreply and one without; filling a template with bytes
+# %-formatting is cheaper than rebuilding the command by concatenation.
+_DELETE_CMD = b'delete %s\r\n'
+_DELETE_NOREPLY_CMD = b'delete %s noreply\r\n'
+_INCR_CMD = b'incr %s %s\r\n'
+_INCR_NOREPLY_CMD = b'incr %s %s noreply\r\n'
+_DECR_CMD = b'decr %s %s\r\n'
+_DECR_NOREPLY_CMD = b'decr %s %s noreply\r\n'
+_TOUCH_CMD = b'touch %s %s\r\n'
+_TOUCH_NOREPLY_CMD = b'touch %s %s noreply\r\n'
+_FLUSH_ALL_CMD = b'flush_all %s\r\n'
+_FLUSH_ALL_NOREPLY_CMD = b'flush_all %s noreply\r\n'
+# Error responses, keyed on the first token of the line. The flag says
+# whether the remainder of the line carries the error detail.
+_ERROR_RESPONSES = {
+    b'ERROR': (MemcacheUnknownCommandError, False),
+    b'CLIENT_ERROR': (MemcacheClientError, True),
+    b'SERVER_ERROR': (MemcacheServerError, True),
+}
 
 
 # Some of the values returned by the "stats" command
@@ -123,8 +169,10 @@ class Client(object):
      The ``connect_timeout`` and ``timeout`` parameters can be used to set
      socket timeout values. By default, timeouts are disabled.
 
-     When the ``no_delay`` flag is set, the ``TCP_NODELAY`` socket option will
-     also be set. This only applies to TCP-based connections.
+     The ``no_delay`` and ``quickack`` flags, which are set by default,
+     control the ``TCP_NODELAY`` and ``TCP_QUICKACK`` socket options.
+     These only apply to TCP-based connections, and ``TCP_QUICKACK`` is
+     only available on Linux.
 
      Lastly, the ``socket_module`` allows you to specify an alternate socket
      implementation (such as `gevent.socket`_).
@@ -213,13 +261,17 @@ class Client(object):
                  deserializer=None,
                  connect_timeout=None,
                  timeout=None,
-                 no_delay=False,
+                 no_delay=True,
                  ignore_exc=False,
                  socket_module=socket,
                  key_prefix=b'',
                  default_noreply=True,
                  allow_unicode_keys=False,
-                 encoding='ascii'):
+                 encoding='ascii',
+                 sndbuf=SOCKET_BUFFER_SIZE,
+                 rcvbuf=SOCKET_BUFFER_SIZE,
+                 quickack=True,
+                 serializer_cache=False):
         """
         Constructor.
 
@@ -234,8 +286,10 @@ class Client(object):
           timeout: optional float, seconds to wait for send or recv calls on
             the socket connected to memcached. Defaults to "forever" (uses the
             underlying default socket timeout, which can be very long).
-          no_delay: optional bool, set the TCP_NODELAY flag, which may help
-            with performance in some cases. Defaults to False.
+          no_delay: optional bool, set the TCP_NODELAY flag, which avoids
+            up to 40ms of delayed-ACK latency on small request/reply
+            exchanges. Defaults to True; pass False to leave Nagle's
+            algorithm enabled.
           ignore_exc: optional bool, True to cause the "get", "gets",
             "get_many" and "gets_many" calls to treat any errors as cache
             misses. Defaults to False.
@@ -248,6 +302,21 @@ class Client(object):
             False).
           allow_unicode_keys: bool, support unicode (utf8) keys
           encoding: optional str, controls data encoding (defaults to 'ascii').
+          sndbuf: optional int, the SO_SNDBUF size requested for the socket,
+            in bytes (defaults to 128KB). Pass None to keep the kernel
+            default.
+          rcvbuf: optional int, the SO_RCVBUF size requested for the socket,
+            in bytes (defaults to 128KB). Pass None to keep the kernel
+            default.
+          quickack: optional bool, set the TCP_QUICKACK flag, which
+            disables delayed ACKs on the receive side. Defaults to True;
+            ignored on platforms without TCP_QUICKACK (it is Linux-only)
+            and on UNIX domain sockets.
+          serializer_cache: optional bool, cache serialized values for
+            recently stored (key, value) pairs, keyed on the value's
+            identity. Off by default because the cache cannot observe
+            in-place mutation of a value that keeps the same id(); only
+            enable it when stored values are not mutated between sets.
 
         Notes:
           The constructor does not make a connection to memcached. The first
@@ -255,6 +324,11 @@ class Client(object):
         """
         self.server = server
         self.serde = serde or LegacyWrappingSerde(serializer, deserializer)
+        # When no deserializer is configured, values come back as raw
+        # bytes and both the int(flags) parse and the deserialize call
+        # are pure overhead per returned key, so skip them entirely.
+        self._passthrough_deserializer = getattr(
+            self.serde, 'passthrough_deserializer', False)
         self.connect_timeout = connect_timeout
         self.timeout = timeout
         self.no_delay = no_delay
@@ -269,6 +343,12 @@ class Client(object):
         self.default_noreply = default_noreply
         self.allow_unicode_keys = allow_unicode_keys
         self.encoding = encoding
+        self.sndbuf = sndbuf
+        self.rcvbuf = rcvbuf
+        self.quickack = quickack
+        self._rearm_quickack = False
+        self._ser_cache = (
+            collections.OrderedDict() if serializer_cache else None)
 
     def check_key(self, key):
         """Checks key and add key_prefix."""
@@ -288,9 +368,24 @@ class Client(object):
             sock.settimeout(self.connect_timeout)
             sock.connect(self.server)
             sock.settimeout(self.timeout)
+            if self.sndbuf is not None:
+                sock.setsockopt(self.socket_module.SOL_SOCKET,
+                                self.socket_module.SO_SNDBUF, self.sndbuf)
+            if self.rcvbuf is not None:
+                sock.setsockopt(self.socket_module.SOL_SOCKET,
+                                self.socket_module.SO_RCVBUF, self.rcvbuf)
             if self.no_delay and sock.family == self.socket_module.AF_INET:
                 sock.setsockopt(self.socket_module.IPPROTO_TCP,
                                 self.socket_module.TCP_NODELAY, 1)
+            self._rearm_quickack = False
+            if self.quickack and sock.family == self.socket_module.AF_INET:
+                try:
+                    sock.setsockopt(self.socket_module.IPPROTO_TCP,
+                                    self.socket_module.TCP_QUICKACK, 1)
+                    self._rearm_quickack = True
+                except AttributeError:
+                    # TCP_QUICKACK is Linux-only.
+                    pass
         except Exception:
             sock.close()
             raise
@@ -555,10 +650,8 @@ class Client(object):
         """
         if noreply is None:
             noreply = self.default_noreply
-        cmd = b'delete ' + self.check_key(key)
-        if noreply:
-            cmd += b' noreply'
-        cmd += b'\r\n'
+        cmd = (_DELETE_NOREPLY_CMD if noreply else _DELETE_CMD) % (
+            self.check_key(key),)
         results = self._misc_cmd([cmd], b'delete', noreply)
         if noreply:
             return True
@@ -585,12 +678,8 @@ class Client(object):
         if noreply is None:
             noreply = self.default_noreply
 
-        cmds = []
-        for key in keys:
-            cmds.append(
-                b'delete ' + self.check_key(key) +
-                (b' noreply' if noreply else b'') +
-                b'\r\n')
+        template = _DELETE_NOREPLY_CMD if noreply else _DELETE_CMD
+        cmds = [template % (self.check_key(key),) for key in keys]
         self._misc_cmd(cmds, b'delete', noreply)
         return True
 
@@ -611,10 +700,7 @@ class Client(object):
         """
         key = self.check_key(key)
         value = self._check_integer(value, "value")
-        cmd = b'incr ' + key + b' ' + value
-        if noreply:
-            cmd += b' noreply'
-        cmd += b'\r\n'
+        cmd = (_INCR_NOREPLY_CMD if noreply else _INCR_CMD) % (key, value)
         results = self._misc_cmd([cmd], b'incr', noreply)
         if noreply:
             return None
@@ -637,10 +723,7 @@ class Client(object):
         """
         key = self.check_key(key)
         value = self._check_integer(value, "value")
-        cmd = b'decr ' + key + b' ' + value
-        if noreply:
-            cmd += b' noreply'
-        cmd += b'\r\n'
+        cmd = (_DECR_NOREPLY_CMD if noreply else _DECR_CMD) % (key, value)
         results = self._misc_cmd([cmd], b'decr', noreply)
         if noreply:
             return None
@@ -667,10 +750,7 @@ class Client(object):
             noreply = self.default_noreply
         key = self.check_key(key)
         expire = self._check_integer(expire, "expire")
-        cmd = b'touch ' + key + b' ' + expire
-        if noreply:
-            cmd += b' noreply'
-        cmd += b'\r\n'
+        cmd = (_TOUCH_NOREPLY_CMD if noreply else _TOUCH_CMD) % (key, expire)
         results = self._misc_cmd([cmd], b'touch', noreply)
         if noreply:
             return True
@@ -749,10 +829,8 @@ class Client(object):
         if noreply is None:
             noreply = self.default_noreply
         delay = self._check_integer(delay, "delay")
-        cmd = b'flush_all ' + delay
-        if noreply:
-            cmd += b' noreply'
-        cmd += b'\r\n'
+        cmd = (_FLUSH_ALL_NOREPLY_CMD if noreply else _FLUSH_ALL_CMD) % (
+            delay,)
         results = self._misc_cmd([cmd], b'flush_all', noreply)
         if noreply:
             return True
@@ -771,16 +849,29 @@ class Client(object):
         self.close()
 
     def _raise_errors(self, line, name):
-        if line.startswith(b'ERROR'):
-            raise MemcacheUnknownCommandError(name)
-
-        if line.startswith(b'CLIENT_ERROR'):
-            error = line[line.find(b' ') + 1:]
-            raise MemcacheClientError(error)
+        # A single dict lookup on the first token replaces three
+        # startswith scans; this runs for every line of every response.
+        space = line.find(b' ')
+        head = line if space == -1 else line[:space]
+        error = _ERROR_RESPONSES.get(head)
+        if error is not None:
+            exception_class, has_detail = error
+            if has_detail:
+                raise exception_class(line[space + 1:])
+            raise exception_class(name)
+
+    def _serialize_value(self, key, data):
+        """Run the serializer and coerce its output to bytes."""
+        data, data_flags = self.serde.serialize(key, data)
+
+        if not isinstance(data, six.binary_type):
+            try:
+                data = six.text_type(data).encode(self.encoding)
+            except UnicodeEncodeError as e:
+                raise MemcacheIllegalInputError(
+                        "Data values must be binary-safe: %s" % e)
 
-        if line.startswith(b'SERVER_ERROR'):
-            error = line[line.find(b' ') + 1:]
-            raise MemcacheServerError(error)
+        return data, data_flags
 
     def _check_integer(self, value, name):
         """Check that a value is an integer and encode it as a binary string"""
@@ -824,17 +915,28 @@ class Client(object):
         of value extraction. In order to use this feature, _extract_value needs
         to be overriden in the subclass.
         """
-        if expect_cas:
-            _, key, flags, size, cas = line.split()
-        else:
-            try:
-                _, key, flags, size = line.split()
-            except Exception as e:
-                raise ValueError("Unable to parse line %s: %s" % (line, e))
+        # Tokenize the header with find/slice instead of a generic split,
+        # which allocates a list plus an object per token; for get_many
+        # over many keys this is the dominant per-key cost. The line is
+        # b'VALUE <key> <flags> <size>[ <cas>]'.
+        try:
+            p1 = line.find(b' ', 6)
+            p2 = line.find(b' ', p1 + 1)
+            key = line[6:p1]
+            flags = line[p1 + 1:p2]
+            if expect_cas:
+                p3 = line.find(b' ', p2 + 1)
+                size = int(line[p2 + 1:p3])
+                cas = line[p3 + 1:]
+            else:
+                size = int(line[p2 + 1:])
+        except Exception as e:
+            raise ValueError("Unable to parse line %s: %s" % (line, e))
 
-        buf, value = _readvalue(self.sock, buf, int(size))
+        buf, value = _readvalue(self.sock, buf, size)
         key = remapped_keys[key]
-        value = self.serde.deserialize(key, value, int(flags))
+        if not self._passthrough_deserializer:
+            value = self.serde.deserialize(key, value, int(flags))
 
         if expect_cas:
             return key, (value, cas), buf
@@ -852,14 +954,23 @@ class Client(object):
             if self.sock is None:
                 self._connect()
 
-            self.sock.sendall(cmd)
+            # Bind the socket locally; attribute lookups on self add up
+            # over a loop that may run once per returned key.
+            sock = self.sock
+            sock.sendall(cmd)
 
             buf = b''
             result = {}
             while True:
-                buf, line = _readline(self.sock, buf)
+                buf, line = _readline(sock, buf)
                 self._raise_errors(line, name)
                 if line == b'END' or line == b'OK':
+                    # Unlike TCP_NODELAY, quickack mode is not sticky:
+                    # the kernel drifts back to delayed ACKs after a few
+                    # segments, so re-arm it once per complete response.
+                    if self._rearm_quickack:
+                        sock.setsockopt(self.socket_module.IPPROTO_TCP,
+                                        self.socket_module.TCP_QUICKACK, 1)
                     return result
                 elif line.startswith(b'VALUE'):
                     key, value, buf = self._extract_value(expect_cas, line, buf,
@@ -885,51 +996,62 @@ class Client(object):
         cmds = []
         keys = []
 
-        extra = b''
         if cas is not None:
             cas = self._check_cas(cas)
-            extra += b' ' + cas
-        if noreply:
-            extra += b' noreply'
+        extra = _STORE_EXTRA[cas is not None, bool(noreply)](cas)
         expire = self._check_integer(expire, "expire")
 
+        ser_cache = self._ser_cache
         for key, data in six.iteritems(values):
             # must be able to reliably map responses back to the original order
             keys.append(key)
 
             key = self.check_key(key)
-            data, data_flags = self.serde.serialize(key, data)
+            if ser_cache is not None:
+                # LRU on (key, value identity): popping before reinserting
+                # keeps the most recently stored entries alive. Each entry
+                # holds a reference to the value object itself, pinning
+                # its id() for the lifetime of the entry so a new value
+                # can never reuse a cached value's id; the identity check
+                # makes a stale hit impossible regardless.
+                cache_key = (key, id(data))
+                cached = ser_cache.pop(cache_key, None)
+                if cached is None or cached[0] is not data:
+                    cached = (data, self._serialize_value(key, data))
+                ser_cache[cache_key] = cached
+                if len(ser_cache) > SERIALIZER_CACHE_SIZE:
+                    ser_cache.popitem(last=False)
+                data, data_flags = cached[1]
+            else:
+                data, data_flags = self._serialize_value(key, data)
 
             # If 'flags' was explicitly provided, it overrides the value
             # returned by the serializer.
             if flags is not None:
                 data_flags = flags
 
-            if not isinstance(data, six.binary_type):
-                try:
-                    data = six.text_type(data).encode(self.encoding)
-                except UnicodeEncodeError as e:
-                    raise MemcacheIllegalInputError(
-                            "Data values must be binary-safe: %s" % e)
-
-            cmds.append(name + b' ' + key + b' ' +
-                        six.text_type(data_flags).encode(self.encoding) +
-                        b' ' + expire +
-                        b' ' + six.text_type(len(data)).encode(self.encoding) +
-                        extra + b'\r\n' + data + b'\r\n')
+            # A single join over the fragments allocates the command once,
+            # instead of one intermediate bytes object per concatenation.
+            cmds.append(b''.join((
+                name, b' ', key, b' ',
+                six.text_type(data_flags).encode(self.encoding),
+                b' ', expire, b' ',
+                six.text_type(len(data)).encode(self.encoding),
+                extra, b'\r\n', data, b'\r\n')))
 
         if self.sock is None:
             self._connect()
 
+        sock = self.sock
         try:
-            self.sock.sendall(b''.join(cmds))
+            _sendall_cmds(sock, cmds)
             if noreply:
                 return {k: True for k in keys}
 
             results = {}
             buf = b''
             for key in keys:
-                buf, line = _readline(self.sock, buf)
+                buf, line = _readline(sock, buf)
                 self._raise_errors(line, name)
 
                 if line in VALID_STORE_RESULTS[name]:
@@ -952,8 +1074,9 @@ class Client(object):
         if self.sock is None:
             self._connect()
 
+        sock = self.sock
         try:
-            self.sock.sendall(b''.join(cmds))
+            _sendall_cmds(sock, cmds)
 
             if noreply:
                 return []
@@ -961,7 +1084,7 @@ class Client(object):
             results = []
             buf = b''
             for cmd in cmds:
-                buf, line = _readline(self.sock, buf)
+                buf, line = _readline(sock, buf)
                 self._raise_errors(line, cmd_name)
                 results.append(line)
             return results
@@ -1008,7 +1131,7 @@ class PooledClient(object):
                  deserializer=None,
                  connect_timeout=None,
                  timeout=None,
-                 no_delay=False,
+                 no_delay=True,
                  ignore_exc=False,
                  socket_module=socket,
                  key_prefix=b'',
@@ -1016,7 +1139,11 @@ class PooledClient(object):
                  lock_generator=None,
                  default_noreply=True,
                  allow_unicode_keys=False,
-                 encoding='ascii'):
+                 encoding='ascii',
+                 sndbuf=SOCKET_BUFFER_SIZE,
+                 rcvbuf=SOCKET_BUFFER_SIZE,
+                 quickack=True,
+                 serializer_cache=False):
         self.server = server
         self.serde = serde or LegacyWrappingSerde(serializer, deserializer)
         self.connect_timeout = connect_timeout
@@ -1037,6 +1164,10 @@ class PooledClient(object):
             max_size=max_pool_size,
             lock_generator=lock_generator)
         self.encoding = encoding
+        self.sndbuf = sndbuf
+        self.rcvbuf = rcvbuf
+        self.quickack = quickack
+        self.serializer_cache = serializer_cache
 
     def check_key(self, key):
         """Checks key and add key_prefix."""
@@ -1055,7 +1186,11 @@ class PooledClient(object):
                         socket_module=self.socket_module,
                         key_prefix=self.key_prefix,
                         default_noreply=self.default_noreply,
-                        allow_unicode_keys=self.allow_unicode_keys)
+                        allow_unicode_keys=self.allow_unicode_keys,
+                        sndbuf=self.sndbuf,
+                        rcvbuf=self.rcvbuf,
+                        quickack=self.quickack,
+                        serializer_cache=self.serializer_cache)
         return client
 
     def close(self):
@@ -1201,6 +1336,56 @@ class PooledClient(object):
         self.delete(key, noreply=True)
 
 
+# Cap on the number of buffers handed to sendmsg at once; POSIX only
+# guarantees IOV_MAX >= 16, but 1024 is the common floor on modern
+# platforms.
+_SENDMSG_MAX_BUFFERS = 1024
+
+
+def _sendall_cmds(sock, cmds):
+    """Send a batch of commands in as few socket writes as possible.
+
+    When the socket supports sendmsg, the command list is handed to the
+    kernel directly (gathered with writev), skipping the allocation and
+    copy of a joined buffer. Otherwise commands are concatenated and
+    flushed whenever the accumulated batch reaches SEND_BATCH_SIZE, so a
+    small batch still goes out in a single sendall while a large batch
+    never needs one giant contiguous buffer.
+    """
+    sendmsg = getattr(sock, 'sendmsg', None)
+    if sendmsg is not None and len(cmds) > 1:
+        index = 0
+        offset = 0
+        total = len(cmds)
+        while index < total:
+            stop = index + _SENDMSG_MAX_BUFFERS
+            if offset:
+                # resume mid-buffer after a short send
+                buffers = [memoryview(cmds[index])[offset:]]
+                buffers.extend(cmds[index + 1:stop])
+            else:
+                buffers = cmds[index:stop]
+            sent = offset + sendmsg(buffers)
+            # advance past every buffer that was sent in full
+            while index < total and sent >= len(cmds[index]):
+                sent -= len(cmds[index])
+                index += 1
+            offset = sent
+        return
+
+    parts = []
+    size = 0
+    for cmd in cmds:
+        parts.append(cmd)
+        size += len(cmd)
+        if size >= SEND_BATCH_SIZE:
+            sock.sendall(b''.join(parts))
+            del parts[:]
+            size = 0
+    if parts:
+        sock.sendall(b''.join(parts))
+
+
 def _readline(sock, buf):
     """Read line of text from the socket.
 
@@ -1221,32 +1406,31 @@ def _readline(sock, buf):
       string).
 
     """
-    chunks = []
-    last_char = b''
-
+    # Fast path: the delimiter is already buffered.
+    idx = buf.find(b'\r\n')
+    if idx != -1:
+        return buf[idx + 2:], buf[:idx]
+
+    # Accumulate received chunks into a single bytearray and resume the
+    # delimiter scan where the previous one left off, so each byte is
+    # scanned exactly once no matter how many chunks the line spans.
+    data = bytearray(buf)
+    recv = sock.recv  # bind once instead of once per chunk
     while True:
-        # We're reading in chunks, so "\r\n" could appear in one chunk,
-        # or across the boundary of two chunks, so we check for both
-        # cases.
-
-        # This case must appear first, since the buffer could have
-        # later \r\n characters in it and we want to get the first \r\n.
-        if last_char == b'\r' and buf[0:1] == b'\n':
-            # Strip the last character from the last chunk.
-            chunks[-1] = chunks[-1][:-1]
-            return buf[1:], b''.join(chunks)
-        elif buf.find(b'\r\n') != -1:
-            before, sep, after = buf.partition(b"\r\n")
-            chunks.append(before)
-            return after, b''.join(chunks)
-
-        if buf:
-            chunks.append(buf)
-            last_char = buf[-1:]
-
-        buf = _recv(sock, RECV_SIZE)
-        if not buf:
+        # Back up one byte so a "\r\n" split across a chunk boundary is
+        # still found.
+        scan = len(data) - 1 if data else 0
+        chunk = _recv(recv, RECV_SIZE)
+        if not chunk:
             raise MemcacheUnexpectedCloseError()
+        data += chunk
+        idx = data.find(b'\r\n', scan)
+        if idx != -1:
+            view = memoryview(data)
+            return view[idx + 2:].tobytes(), view[:idx].tobytes()
+        if len(data) > MAX_LINE_SIZE:
+            raise MemcacheUnknownError(
+                'Response line exceeded %d bytes' % MAX_LINE_SIZE)
 
 
 def _readvalue(sock, buf, size):
@@ -1269,36 +1453,57 @@ def _readvalue(sock, buf, size):
       including the \r\n).
 
     """
-    chunks = []
-    rlen = size + 2
-    while rlen - len(buf) > 0:
-        if buf:
-            rlen -= len(buf)
-            chunks.append(buf)
-        buf = _recv(sock, RECV_SIZE)
-        if not buf:
+    want = size + 2
+    have = len(buf)
+
+    # Fast path: the value (and its trailing "\r\n") is already buffered.
+    if have >= want:
+        return buf[want:], buf[:size]
+
+    # Receive directly into a preallocated buffer of the exact size, so
+    # the value is copied once rather than accumulated in chunks that are
+    # joined (and copied again) at the end.
+    data = bytearray(want)
+    data[:have] = buf
+    recv_into = sock.recv_into  # bind once instead of once per chunk
+    view = memoryview(data)  # sliced per chunk without copying
+    while have < want:
+        received = _recv_into(recv_into, view[have:])
+        if not received:
             raise MemcacheUnexpectedCloseError()
+        have += received
 
-    # Now we need to remove the \r\n from the end. There are two cases we care
-    # about: the \r\n is all in the last buffer, or only the \n is in the last
-    # buffer, and we need to remove the \r from the penultimate buffer.
+    return b'', view[:size].tobytes()
 
-    if rlen == 1:
-        # replace the last chunk with the same string minus the last character,
-        # which is always '\r' in this case.
-        chunks[-1] = chunks[-1][:-1]
-    else:
-        # Just remove the "\r\n" from the latest chunk
-        chunks.append(buf[:rlen - 2])
 
-    return buf[rlen:], b''.join(chunks)
+def _recv(recv, size):
+    """Call a bound sock.recv with retry on EINTR"""
+    while True:
+        try:
+            return recv(size)
+        except IOError as e:
+            if e.errno != errno.EINTR:
+                raise
 
 
-def _recv(sock, size):
-    """sock.recv() with retry on EINTR"""
+def _recv_into(recv_into, view):
+    """Call a bound sock.recv_into with retry on EINTR"""
     while True:
         try:
-            return sock.recv(size)
+            return recv_into(view)
         except IOError as e:
             if e.errno != errno.EINTR:
                 raise
+
+
+try:
+    # Accelerated implementations of the read helpers above, built from
+    # pymemcache/client/_socketio.pyx when Cython is available at install
+    # time. They scan for "\r\n" with memchr instead of Python-level
+    # find. The pure Python implementations remain the fallback.
+    from pymemcache.client._socketio import (  # noqa: F811
+        readline as _readline,
+        readvalue as _readvalue,
+    )
+except ImportError:
+    pass
@@ -3,7 +3,12 @@ import time
 import logging
 import six
 
-from pymemcache.client.base import Client, PooledClient, _check_key
+from pymemcache.client.base import (
+    Client,
+    PooledClient,
+    SOCKET_BUFFER_SIZE,
+    _check_key
+)
 from pymemcache.client.rendezvous import RendezvousHash
 from pymemcache.exceptions import MemcacheError
 
@@ -24,7 +29,7 @@ class HashClient(object):
         deserializer=None,
         connect_timeout=None,
         timeout=None,
-        no_delay=False,
+        no_delay=True,
         socket_module=socket,
         key_prefix=b'',
         max_pool_size=None,
@@ -36,7 +41,11 @@ class HashClient(object):
         ignore_exc=False,
         allow_unicode_keys=False,
         default_noreply=True,
-        encoding='ascii'
+        encoding='ascii',
+        sndbuf=SOCKET_BUFFER_SIZE,
+        rcvbuf=SOCKET_BUFFER_SIZE,
+        quickack=True,
+        serializer_cache=False
     ):
         """
         Constructor.
@@ -87,6 +96,10 @@ class HashClient(object):
             'deserializer': deserializer,
             'allow_unicode_keys': allow_unicode_keys,
             'default_noreply': default_noreply,
+            'sndbuf': sndbuf,
+            'rcvbuf': rcvbuf,
+            'quickack': quickack,
+            'serializer_cache': serializer_cache,
         }
 
         if use_pooling is True:
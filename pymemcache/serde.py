@@ -148,6 +148,9 @@ class LegacyWrappingSerde(object):
     def __init__(self, serializer_func, deserializer_func):
         self.serialize = serializer_func or self._default_serialize
         self.deserialize = deserializer_func or self._default_deserialize
+        # True when deserialize is the identity fallback; clients use this
+        # to skip per-value deserialization work entirely.
+        self.passthrough_deserializer = deserializer_func is None
 
     def _default_serialize(self, key, value):
         return value, 0
@@ -1,6 +1,13 @@
+import sys
+
 import pytest
 import socket
 
+collect_ignore = []
+if sys.version_info < (3, 5):
+    # uses async/await syntax, which does not parse on older versions
+    collect_ignore.append('test_client_aio.py')
+
 
 def pytest_addoption(parser):
     parser.addoption('--server', action='store', default='localhost',
@@ -68,6 +68,17 @@ class MockSocket(object):
             raise value
         return value
 
+    def recv_into(self, buf):
+        value = self.recv_bufs.popleft()
+        if isinstance(value, Exception):
+            raise value
+        received = min(len(buf), len(value))
+        buf[:received] = value[:received]
+        # anything that didn't fit stays queued for the next read
+        if received < len(value):
+            self.recv_bufs.appendleft(value[received:])
+        return received
+
     def settimeout(self, timeout):
         self.timeouts.append(timeout)
 
@@ -870,6 +881,146 @@ class TestClient(ClientTestMixin, unittest.TestCase):
 
         assert client.sock is None
 
+    def test_unterminated_line_is_bounded(self):
+        # a server that streams data without ever terminating the line
+        # fails fast instead of buffering without bound
+        chunk = b'x' * (3 * 1024 * 1024)
+        client = self.make_client([chunk, chunk])
+        with pytest.raises(MemcacheUnknownError):
+            client.get(b'key')
+        assert client.sock is None
+
+    @pytest.mark.skipif(not hasattr(socket, 'TCP_QUICKACK'),
+                        reason='TCP_QUICKACK is Linux-only')
+    def test_get_rearms_quickack(self):
+        client = self.make_client([b'END\r\n'])
+        client._rearm_quickack = True
+        client.get(b'key')
+        assert client.sock.socket_options == [
+            (socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1),
+        ]
+
+    def test_serializer_cache(self):
+        serializer_calls = []
+
+        def serializer(key, value):
+            serializer_calls.append(key)
+            return value, 0
+
+        client = self.make_client([b'STORED\r\n'] * 3,
+                                  serializer=serializer,
+                                  serializer_cache=True)
+        value = b'value'
+        client.set(b'key', value, noreply=False)
+        client.set(b'key', value, noreply=False)
+        assert serializer_calls == [b'key']
+
+        # a different value object for the same key is a cache miss
+        client.set(b'key', b'other', noreply=False)
+        assert serializer_calls == [b'key', b'key']
+
+    def test_serializer_cache_id_reuse(self):
+        serialized = []
+
+        def serializer(key, value):
+            serialized.append(value['payload'])
+            return value['payload'].encode('ascii'), 0
+
+        client = self.make_client([b'STORED\r\n'] * 2,
+                                  serializer=serializer,
+                                  serializer_cache=True)
+        value = {'payload': 'FIRST'}
+        client.set(b'key', value, noreply=False)
+        del value
+        # once the first value is garbage collected, a brand-new value
+        # may be allocated at the same id(); it must not be served the
+        # first value's serialized bytes
+        client.set(b'key', {'payload': 'SECOND'}, noreply=False)
+        assert serialized == ['FIRST', 'SECOND']
+        assert client.sock.send_bufs[-1].endswith(b'SECOND\r\n')
+
+    def test_serializer_cache_disabled_by_default(self):
+        serializer_calls = []
+
+        def serializer(key, value):
+            serializer_calls.append(key)
+            return value, 0
+
+        client = self.make_client([b'STORED\r\n'] * 2,
+                                  serializer=serializer)
+        value = b'value'
+        client.set(b'key', value, noreply=False)
+        client.set(b'key', value, noreply=False)
+        assert serializer_calls == [b'key', b'key']
+
+    def test_set_many_pipelined(self):
+        # all commands go out in a single sendall and the replies are
+        # drained afterwards, so N keys only cost one round trip
+        client = self.make_client([b'STORED\r\n', b'STORED\r\n'])
+        result = client.set_many(
+            collections.OrderedDict([(b'key', b'value'),
+                                     (b'other', b'value2')]),
+            noreply=False)
+        assert result == []
+        assert client.sock.closed is False
+        assert len(client.sock.send_bufs) == 1
+        assert len(client.sock.recv_bufs) == 0
+
+    def test_set_many_uses_sendmsg(self):
+        # when the socket offers sendmsg, batches are scatter-sent as a
+        # buffer list instead of being joined; short sends are resumed
+        class SendmsgSocket(MockSocket):
+            def __init__(self, recv_bufs):
+                MockSocket.__init__(self, recv_bufs)
+                self.sendmsg_calls = 0
+                self.sent = b''
+
+            def sendmsg(self, buffers):
+                self.sendmsg_calls += 1
+                data = b''.join(bytes(b) for b in buffers)
+                # accept only half of the first call to exercise the
+                # resume-after-short-send path
+                accepted = len(data) // 2 if self.sendmsg_calls == 1 \
+                    else len(data)
+                self.sent += data[:accepted]
+                return accepted
+
+        client = Client(None)
+        client.sock = SendmsgSocket([b'STORED\r\n', b'STORED\r\n'])
+        result = client.set_many(
+            collections.OrderedDict([(b'key1', b'value1'),
+                                     (b'key2', b'value2')]),
+            noreply=False)
+        assert result == []
+        assert client.sock.sendmsg_calls == 2
+        assert client.sock.sent == (b'set key1 0 0 6\r\nvalue1\r\n'
+                                    b'set key2 0 0 6\r\nvalue2\r\n')
+        assert client.sock.send_bufs == []
+
+    def test_set_many_flushes_large_batches(self):
+        # batches larger than SEND_BATCH_SIZE are flushed incrementally
+        # rather than joined into one giant buffer
+        client = self.make_client([b'STORED\r\n'] * 3)
+        value = b'x' * (64 * 1024)
+        result = client.set_many(
+            collections.OrderedDict([(b'key1', value),
+                                     (b'key2', value),
+                                     (b'key3', value)]),
+            noreply=False)
+        assert result == []
+        assert len(client.sock.send_bufs) == 2
+        assert b''.join(client.sock.send_bufs).count(b'\r\n') == 6
+
+    def test_delete_many_socket_handling(self):
+        # delete_many pipelines the same way as set_many: one sendall,
+        # then all replies are read back
+        client = self.make_client([b'DELETED\r\n', b'NOT_FOUND\r\n'])
+        result = client.delete_many([b'key', b'key2'], noreply=False)
+        assert result is True
+        assert client.sock.closed is False
+        assert len(client.sock.send_bufs) == 1
+        assert len(client.sock.recv_bufs) == 0
+
     def test_stats(self):
         client = self.make_client([b'STAT fake_stats 1\r\n', b'END\r\n'])
         result = client.stats()
@@ -982,6 +1133,14 @@ class TestClient(ClientTestMixin, unittest.TestCase):
         with pytest.raises(MemcacheClientError):
             client.get(b'abc xyz')
 
+    def test_get_many_checks_keys_before_sending(self):
+        # every key is validated up front, so a bad key anywhere in the
+        # batch fails before any command bytes hit the wire
+        client = self.make_client([b'END\r\n'])
+        with pytest.raises(MemcacheClientError):
+            client.get_many([b'good_key', b'abc xyz'])
+        assert client.sock is None
+
     def test_key_contains_nonascii(self):
         client = self.make_client([b'END\r\n'])
 
@@ -1082,15 +1241,33 @@ class TestClientSocketConnect(unittest.TestCase):
         client._connect()
         assert client.sock.timeouts == [connect_timeout, timeout]
 
-        client = Client(server, socket_module=MockSocketModule())
+        client = Client(
+            server, socket_module=MockSocketModule(), no_delay=False,
+            sndbuf=None, rcvbuf=None, quickack=False)
         client._connect()
         assert client.sock.socket_options == []
 
+        # TCP_NODELAY, TCP_QUICKACK (where available) and 128KB socket
+        # buffers are requested by default
+        client = Client(server, socket_module=MockSocketModule())
+        client._connect()
+        expected = [
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, 128 * 1024),
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, 128 * 1024),
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        ]
+        if hasattr(socket, 'TCP_QUICKACK'):
+            expected.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+        assert client.sock.socket_options == expected
+
         client = Client(
-            server, socket_module=MockSocketModule(), no_delay=True)
+            server, socket_module=MockSocketModule(), no_delay=False,
+            sndbuf=65536, rcvbuf=32768, quickack=False)
         client._connect()
-        assert client.sock.socket_options == [(socket.IPPROTO_TCP,
-                                               socket.TCP_NODELAY, 1)]
+        assert client.sock.socket_options == [
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, 65536),
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, 32768),
+        ]
 
     def test_socket_connect_unix(self):
         server = '/tmp/pymemcache.{pid}'.format(pid=os.getpid())
@@ -0,0 +1,159 @@
+# Copyright 2012 Pinterest.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import unittest
+
+import pytest
+
+from pymemcache.client.aio import AsyncClient
+from pymemcache.exceptions import (
+    MemcacheClientError,
+    MemcacheUnexpectedCloseError,
+    MemcacheUnknownError,
+)
+
+
+class MockStreamWriter(object):
+    def __init__(self):
+        self.write_bufs = []
+        self.closed = False
+
+    def write(self, data):
+        self.write_bufs.append(data)
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def make_client(mock_stream_values, eof=True, **kwargs):
+    client = AsyncClient(None, **kwargs)
+    reader = asyncio.StreamReader()
+    for value in mock_stream_values:
+        reader.feed_data(value)
+    # feeding EOF makes reads past the canned replies fail instead of
+    # hanging the test
+    if eof:
+        reader.feed_eof()
+    writer = MockStreamWriter()
+
+    async def _connect():
+        client._reader = reader
+        client._writer = writer
+
+    client._connect = _connect
+    return client, writer
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.mark.unit()
+class TestAsyncClient(unittest.TestCase):
+    def test_set_success(self):
+        client, writer = make_client([b'STORED\r\n'])
+        result = run(client.set(b'key', b'value', noreply=False))
+        assert result is True
+        assert writer.write_bufs == [b'set key 0 0 5\r\nvalue\r\n']
+
+    def test_set_noreply(self):
+        client, writer = make_client([])
+        result = run(client.set(b'key', b'value'))
+        assert result is True
+        assert writer.write_bufs == [b'set key 0 0 5 noreply\r\nvalue\r\n']
+
+    def test_set_many_single_write(self):
+        client, writer = make_client([b'STORED\r\n', b'STORED\r\n'])
+        result = run(client.set_many(
+            {b'key1': b'value1', b'key2': b'value2'}, noreply=False))
+        assert result == []
+        # both commands go out in one write, before the first reply is
+        # awaited
+        assert len(writer.write_bufs) == 1
+
+    def test_get_found(self):
+        client, _ = make_client([b'VALUE key 0 5\r\nvalue\r\nEND\r\n'])
+        result = run(client.get(b'key'))
+        assert result == b'value'
+
+    def test_get_miss(self):
+        client, _ = make_client([b'END\r\n'])
+        result = run(client.get(b'key'))
+        assert result is None
+
+    def test_get_many_all_found(self):
+        client, writer = make_client([
+            b'VALUE key1 0 6\r\nvalue1\r\n'
+            b'VALUE key2 0 6\r\nvalue2\r\nEND\r\n',
+        ])
+        result = run(client.get_many([b'key1', b'key2']))
+        assert result == {b'key1': b'value1', b'key2': b'value2'}
+        assert writer.write_bufs == [b'get key1 key2\r\n']
+
+    def test_gets_found(self):
+        client, _ = make_client([b'VALUE key 0 5 10\r\nvalue\r\nEND\r\n'])
+        result = run(client.gets(b'key'))
+        assert result == (b'value', b'10')
+
+    def test_delete_found(self):
+        client, _ = make_client([b'DELETED\r\n'])
+        result = run(client.delete(b'key', noreply=False))
+        assert result is True
+
+    def test_incr_found(self):
+        client, _ = make_client([b'2\r\n'])
+        result = run(client.incr(b'key', 1, noreply=False))
+        assert result == 2
+
+    def test_error_closes_connection(self):
+        client, writer = make_client([b'CLIENT_ERROR bad command\r\n'])
+        with pytest.raises(MemcacheClientError):
+            run(client.delete(b'key', noreply=False))
+        assert writer.closed
+        assert client._writer is None
+
+    def test_unterminated_line_is_bounded(self):
+        # a server that streams data without ever terminating the line
+        # fails fast instead of buffering without bound; the stream's
+        # default limit is 64KB. The stream is left open so the limit,
+        # not EOF, is what trips.
+        client, _ = make_client([b'x' * (64 * 1024 + 16)], eof=False)
+        with pytest.raises(MemcacheUnknownError):
+            run(client.get(b'key'))
+        assert client._writer is None
+
+    def test_unexpected_close(self):
+        client, _ = make_client([])
+        with pytest.raises(MemcacheUnexpectedCloseError):
+            run(client.get(b'key'))
+
+    def test_concurrent_gets_are_serialized(self):
+        client, writer = make_client([
+            b'VALUE key1 0 6\r\nvalue1\r\nEND\r\n',
+            b'VALUE key2 0 6\r\nvalue2\r\nEND\r\n',
+        ])
+
+        async def _gets():
+            return await asyncio.gather(
+                client.get(b'key1'), client.get(b'key2'))
+
+        assert run(_gets()) == [b'value1', b'value2']
+        assert writer.write_bufs == [b'get key1\r\n', b'get key2\r\n']
@@ -2,6 +2,7 @@
 from unittest import TestCase
 
 from pymemcache.serde import (pickle_serde,
+                              LegacyWrappingSerde,
                               PickleSerde,
                               FLAG_BYTES,
                               FLAG_PICKLE, FLAG_INTEGER, FLAG_LONG, FLAG_TEXT)
@@ -64,6 +65,20 @@ class TestSerde(TestCase):
         self.check(CustomInt(123123), FLAG_PICKLE)
 
 
+@pytest.mark.unit()
+class TestLegacyWrappingSerde(TestCase):
+    def test_passthrough_deserializer_flag(self):
+        serde = LegacyWrappingSerde(None, None)
+        assert serde.passthrough_deserializer is True
+        assert serde.deserialize(b'key', b'value', 0) == b'value'
+
+        def deserializer(key, value, flags):
+            return value
+
+        serde = LegacyWrappingSerde(None, deserializer)
+        assert serde.passthrough_deserializer is False
+
+
 @pytest.mark.unit()
 class TestSerdePickleVersion0(TestCase):
     serde = PickleSerde(pickle_version=0)
@@ -0,0 +1,109 @@
+# Copyright 2012 Pinterest.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Direct tests for the optional C socket read helpers.
+
+The rest of the suite exercises whichever implementation of _readline
+and _readvalue pymemcache.client.base happened to import, so these
+tests target pymemcache.client._socketio explicitly and are skipped
+when the extension has not been built.
+"""
+import errno
+
+import pytest
+
+from pymemcache.exceptions import (
+    MemcacheUnexpectedCloseError,
+    MemcacheUnknownError,
+)
+from pymemcache.test.test_client import MockSocket
+
+_socketio = pytest.importorskip('pymemcache.client._socketio')
+
+
+@pytest.mark.unit()
+class TestReadline(object):
+    def test_line_already_buffered(self):
+        sock = MockSocket([])
+        buf, line = _socketio.readline(sock, b'STORED\r\nEND\r\n')
+        assert line == b'STORED'
+        assert buf == b'END\r\n'
+
+    def test_line_spans_chunks(self):
+        sock = MockSocket([b' 0 5\r\nvalue'])
+        buf, line = _socketio.readline(sock, b'VALUE key')
+        assert line == b'VALUE key 0 5'
+        assert buf == b'value'
+
+    def test_crlf_split_across_chunks(self):
+        sock = MockSocket([b'STORED\r', b'\nEND\r\n'])
+        buf, line = _socketio.readline(sock, b'')
+        assert line == b'STORED'
+        assert buf == b'END\r\n'
+
+    def test_lone_cr_is_not_a_terminator(self):
+        sock = MockSocket([b'STO\rRED\r\n'])
+        buf, line = _socketio.readline(sock, b'')
+        assert line == b'STO\rRED'
+        assert buf == b''
+
+    def test_eintr_is_retried(self):
+        sock = MockSocket([IOError(errno.EINTR, 'interrupted'),
+                           b'STORED\r\n'])
+        buf, line = _socketio.readline(sock, b'')
+        assert line == b'STORED'
+        assert buf == b''
+
+    def test_closed_connection(self):
+        sock = MockSocket([b''])
+        with pytest.raises(MemcacheUnexpectedCloseError):
+            _socketio.readline(sock, b'partial')
+
+    def test_unterminated_line_is_bounded(self):
+        chunk = b'x' * (3 * 1024 * 1024)
+        sock = MockSocket([chunk, chunk])
+        with pytest.raises(MemcacheUnknownError):
+            _socketio.readline(sock, b'')
+
+
+@pytest.mark.unit()
+class TestReadvalue(object):
+    def test_value_already_buffered(self):
+        sock = MockSocket([])
+        buf, value = _socketio.readvalue(sock, b'value\r\nEND\r\n', 5)
+        assert value == b'value'
+        assert buf == b'END\r\n'
+
+    def test_value_spans_chunks(self):
+        sock = MockSocket([b'lu', b'e\r\n'])
+        buf, value = _socketio.readvalue(sock, b'va', 5)
+        assert value == b'value'
+        assert buf == b''
+
+    def test_value_contains_crlf(self):
+        sock = MockSocket([b'va\r\nue\r\n'])
+        buf, value = _socketio.readvalue(sock, b'', 6)
+        assert value == b'va\r\nue'
+        assert buf == b''
+
+    def test_eintr_is_retried(self):
+        sock = MockSocket([IOError(errno.EINTR, 'interrupted'),
+                           b'value\r\n'])
+        buf, value = _socketio.readvalue(sock, b'', 5)
+        assert value == b'value'
+        assert buf == b''
+
+    def test_closed_connection(self):
+        sock = MockSocket([b'val', b''])
+        with pytest.raises(MemcacheUnexpectedCloseError):
+            _socketio.readvalue(sock, b'', 5)
@@ -24,7 +24,7 @@ class MockMemcacheClient(object):
                  serde=None,
                  connect_timeout=None,
                  timeout=None,
-                 no_delay=False,
+                 no_delay=True,
                  ignore_exc=False,
                  default_noreply=True,
                  allow_unicode_keys=False,
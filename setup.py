@@ -2,4 +2,13 @@
 
 from setuptools import setup
 
-setup()
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # The accelerated socket helpers are optional; the pure Python
+    # implementations in pymemcache.client.base are used instead.
+    ext_modules = []
+else:
+    ext_modules = cythonize(['pymemcache/client/_socketio.pyx'])
+
+setup(ext_modules=ext_modules)